@@ -383,7 +383,7 @@ def workspace_validate(
                     status = "PASS" if check.passed else "FAIL"
                     click.echo(f"  [{status}] {check.name} ({check.duration:.2f}s)")
                     if not check.passed and check.error:
-                        for line in check.error.split("\n")[:10]:
+                        for line in check.error.split("\n", 10)[:10]:
                             click.echo(f"        {line}")
 
                 click.echo(f"\n{result.summary()}")
@@ -51,6 +51,9 @@ class CompanionConfig(BaseModel):
     model_base_url: str = "http://localhost:8000/v1"
     model_api_key: str = ""
     max_turns_per_message: int = 10
+    # Counted in messages; kept even so the window always holds whole
+    # user/assistant exchanges and starts with a user turn.
+    history_window: int = Field(default=32, ge=2, multiple_of=2)
 
 
 __all__ = ["CompanionConfig", "IndexingConfig"]
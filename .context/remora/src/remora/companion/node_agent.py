@@ -5,6 +5,7 @@ import asyncio
 import logging
 import time
 import uuid
+from collections import deque
 from typing import TYPE_CHECKING
 
 from pydantic import BaseModel
@@ -69,9 +70,16 @@ class NodeAgent:
         self.workspace = workspace
         self._event_bus = event_bus
         self._config = config
-        self._history: list[NodeMessage] = []
+        # Only the last ``history_window`` messages are sent to the model; older
+        # ones fall out of its context (the chat/*.md transcript keeps them).
+        # deque(maxlen=...) evicts them in O(1).
+        self._history: deque[NodeMessage] = deque(maxlen=config.history_window)
         self._last_visited: float = time.time()
         self._session_id = str(uuid.uuid4())
+        # Tool closures only capture the workspace, so the built list (and the
+        # schemas introspected for it) is reused across turns until that changes.
+        self._tools: list | None = None
+        self._tools_workspace: "AgentWorkspace | None" = None
 
     @property
     def node_id(self) -> str:
@@ -118,26 +126,35 @@ class NodeAgent:
         user_msg = NodeMessage.user(content)
         self._history.append(user_msg)
 
-        system_prompt = await self._build_system_prompt()
-        kernel_messages = [KernelMessage(role="system", content=system_prompt)]
-        kernel_messages += [KernelMessage(role=msg.role, content=msg.content) for msg in self._history]
-
-        tools = self._build_tools()
-        kernel = create_kernel(
-            model_name=self._config.model_name,
-            base_url=self._config.model_base_url,
-            api_key=self._config.model_api_key or "EMPTY",
-            tools=tools,
-            observer=self._event_bus,
-        )
         try:
-            result = await kernel.run(
-                kernel_messages,
-                [tool.schema for tool in tools],
-                max_turns=self._config.max_turns_per_message,
+            system_prompt = await self._build_system_prompt()
+            kernel_messages = [
+                KernelMessage(role="system", content=system_prompt),
+                *(KernelMessage(role=msg.role, content=msg.content) for msg in self._history),
+            ]
+
+            tools = self._build_tools()
+            kernel = create_kernel(
+                model_name=self._config.model_name,
+                base_url=self._config.model_base_url,
+                api_key=self._config.model_api_key or "EMPTY",
+                tools=tools,
+                observer=self._event_bus,
             )
-        finally:
-            await kernel.close()
+            try:
+                result = await kernel.run(
+                    kernel_messages,
+                    [tool.schema for tool in tools],
+                    max_turns=self._config.max_turns_per_message,
+                )
+            finally:
+                await kernel.close()
+        except BaseException:
+            # Drop the unanswered message so history keeps alternating
+            # user/assistant; strict chat templates reject two user turns.
+            if self._history and self._history[-1] is user_msg:
+                self._history.pop()
+            raise
 
         assistant_msg = NodeMessage.assistant(result.final_message.content or "")
         self._history.append(assistant_msg)
@@ -175,9 +192,12 @@ class NodeAgent:
         return base
 
     def _build_tools(self) -> list:
-        from remora.companion.node_agent_tools import build_node_agent_tools
+        if self._tools is None or self._tools_workspace is not self.workspace:
+            from remora.companion.node_agent_tools import build_node_agent_tools
 
-        return build_node_agent_tools(self)
+            self._tools = build_node_agent_tools(self)
+            self._tools_workspace = self.workspace
+        return list(self._tools)
 
     async def _persist_exchange(self, user_msg: NodeMessage, assistant_msg: NodeMessage) -> None:
         timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
@@ -8,13 +8,14 @@ through Cairn.
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import os
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Coroutine
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 from cairn.runtime import workspace_manager as cairn_workspace_manager
 from cairn.runtime.workspace_manager import open_workspace as cairn_open_workspace
@@ -27,9 +28,69 @@ from remora.utils import PathLike, PathResolver, normalize_path
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 OPEN_WORKSPACE_PROGRESS_INTERVAL_SECONDS = 5.0
 SYNC_PROGRESS_INTERVAL_SECONDS = 2.0
 SYNC_PROGRESS_FILE_INTERVAL = 2000
+SYNC_CONCURRENCY = 32
+SYNC_WRITE_QUEUE_SIZE = 64
+SYNC_INDEX_FILENAME = "sync.idx"
+# Small files are read in groups so one worker-thread hop covers several of
+# them; a group closes at whichever limit is reached first.
+SYNC_READ_BATCH_FILES = 16
+SYNC_READ_BATCH_BYTES = 256 * 1024
+
+
+def _read_files(paths: list[Path]) -> list[bytes | OSError]:
+    """Read *paths* in order, returning each file's bytes or the error raised."""
+    results: list[bytes | OSError] = []
+    for path in paths:
+        try:
+            results.append(path.read_bytes())
+        except OSError as exc:
+            results.append(exc)
+    return results
+
+
+def _read_sync_index(index_path: Path) -> dict[str, tuple[int, int]]:
+    """Load the persisted sync index, or an empty one if it is missing or unreadable."""
+    try:
+        raw = json.loads(index_path.read_text(encoding="utf-8"))
+        return {rel_path: (int(mtime_ns), int(size)) for rel_path, (mtime_ns, size) in raw.items()}
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, TypeError, AttributeError) as exc:
+        logger.debug("Ignoring unreadable sync index %s: %s", index_path, exc)
+    return {}
+
+
+def _write_sync_index(index_path: Path, index: dict[str, tuple[int, int]]) -> None:
+    try:
+        index_path.write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+    except OSError as exc:
+        logger.debug("Failed to persist sync index %s: %s", index_path, exc)
+
+
+async def _single_flight(
+    key: str,
+    registry: dict[str, asyncio.Task[_T]],
+    factory: Callable[[], Coroutine[Any, Any, _T]],
+) -> _T:
+    """Await the in-flight task for *key*, starting one from *factory* if none is registered."""
+    task = registry.get(key)
+    if task is None:
+        task = asyncio.create_task(factory())
+        registry[key] = task
+
+        def _forget(done: asyncio.Task[_T]) -> None:
+            if registry.get(key) is done:
+                del registry[key]
+
+        task.add_done_callback(_forget)
+
+    # Shield so one cancelled caller does not abort the task for the others.
+    return await asyncio.shield(task)
 
 
 class SyncMode(Enum):
@@ -56,22 +117,29 @@ class CairnWorkspaceService:
 
         base_path = normalize_path(swarm_root or config.swarm_root)
         self._swarm_root = base_path / self._graph_id
-        self._project_root = normalize_path(project_root or Path.cwd()).resolve()
-        self._resolver = PathResolver(self._project_root)
+        # PathResolver resolves its root once; reuse it rather than resolving twice.
+        self._resolver = PathResolver(project_root or Path.cwd())
+        self._project_root: Path = self._resolver.project_root
         self._manager = cairn_workspace_manager.WorkspaceManager()
         self._stable_workspace: Any | None = None
         self._agent_workspaces: dict[str, AgentWorkspace] = {}
-        self._agent_workspaces_lock = asyncio.Lock()
-        self._ignore_patterns: set[str] = set(config.workspace_ignore_patterns or DEFAULT_IGNORE_PATTERNS)
+        self._agent_open_tasks: dict[str, asyncio.Task[AgentWorkspace]] = {}
+        self._externals_cache: dict[str, tuple[AgentWorkspace, dict[str, Any]]] = {}
+        self._file_sync_tasks: dict[str, asyncio.Task[bool]] = {}
+        self._ignore_patterns: frozenset[str] = frozenset(config.workspace_ignore_patterns or DEFAULT_IGNORE_PATTERNS)
         self._ignore_dotfiles: bool = config.workspace_ignore_dotfiles
-        self._file_mtimes: dict[str, float] = {}
+        # rel_path -> (mtime_ns, size) of the copy last written to the stable workspace.
+        self._sync_index: dict[str, tuple[int, int]] = {}
+        self._sync_index_loaded = False
         self._progress_callback = progress_callback
 
     def _reset_runtime_state(self) -> None:
         self._manager = cairn_workspace_manager.WorkspaceManager()
         self._stable_workspace = None
         self._agent_workspaces = {}
-        self._agent_workspaces_lock = asyncio.Lock()
+        self._agent_open_tasks = {}
+        self._externals_cache = {}
+        self._file_sync_tasks = {}
 
     @property
     def project_root(self) -> Path:
@@ -98,6 +166,16 @@ class CairnWorkspaceService:
             )
         self._swarm_root.mkdir(parents=True, exist_ok=True)
         stable_path = self._swarm_root / "stable.db"
+        if not stable_path.exists():
+            # A fresh stable workspace holds none of the indexed files. Drop the
+            # on-disk index too, or a later FULL sync would load it and skip
+            # files this stable.db never received.
+            self._sync_index = {}
+            self._sync_index_loaded = True
+            try:
+                (self._swarm_root / SYNC_INDEX_FILENAME).unlink(missing_ok=True)
+            except OSError as exc:
+                logger.debug("Failed to remove stale sync index: %s", exc)
 
         try:
             self._progress(f"opening stable workspace at {stable_path}")
@@ -132,50 +210,63 @@ class CairnWorkspaceService:
             self._progress("sync skipped (mode=none)")
 
     async def get_agent_workspace(self, agent_id: str) -> AgentWorkspace:
-        """Get or create an agent workspace."""
-        if agent_id in self._agent_workspaces:
-            return self._agent_workspaces[agent_id]
+        """Get or create an agent workspace.
 
-        async with self._agent_workspaces_lock:
-            if agent_id in self._agent_workspaces:
-                return self._agent_workspaces[agent_id]
+        Concurrent callers for the same agent share a single in-flight open
+        (single-flight), while opens for different agents proceed in parallel.
+        """
+        agent_workspace = self._agent_workspaces.get(agent_id)
+        if agent_workspace is not None:
+            return agent_workspace
 
-            if self._stable_workspace is None:
-                raise WorkspaceError("CairnWorkspaceService is not initialized")
+        if self._stable_workspace is None:
+            raise WorkspaceError("CairnWorkspaceService is not initialized")
 
-            workspace_path = self._swarm_root / "agents" / agent_id[:2] / agent_id / "workspace.db"
-            workspace_path.parent.mkdir(parents=True, exist_ok=True)
+        return await _single_flight(agent_id, self._agent_open_tasks, lambda: self._open_agent_workspace(agent_id))
 
-            try:
-                workspace = await cairn_open_workspace(
-                    workspace_path,
-                    readonly=False,
-                )
-                self._manager.track_workspace(workspace)
-            except Exception as exc:
-                raise WorkspaceError(f"Failed to create workspace for {agent_id}: {exc}") from exc
-
-            agent_workspace = AgentWorkspace(
-                workspace,
-                agent_id,
-                stable_workspace=self._stable_workspace,
-                ensure_file_synced=self.ensure_file_synced,
+    async def _open_agent_workspace(self, agent_id: str) -> AgentWorkspace:
+        workspace_path = self._swarm_root / "agents" / agent_id[:2] / agent_id / "workspace.db"
+        workspace_path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            workspace = await cairn_open_workspace(
+                workspace_path,
+                readonly=False,
             )
-            self._agent_workspaces[agent_id] = agent_workspace
-            return agent_workspace
+            self._manager.track_workspace(workspace)
+        except Exception as exc:
+            raise WorkspaceError(f"Failed to create workspace for {agent_id}: {exc}") from exc
+
+        agent_workspace = AgentWorkspace(
+            workspace,
+            agent_id,
+            stable_workspace=self._stable_workspace,
+            ensure_file_synced=self.ensure_file_synced,
+        )
+        self._agent_workspaces[agent_id] = agent_workspace
+        return agent_workspace
 
     def get_externals(self, agent_id: str, agent_workspace: AgentWorkspace) -> dict[str, Any]:
-        """Build Cairn external helpers for Grail tools."""
+        """Build Cairn external helpers for Grail tools.
+
+        The helpers only depend on the agent workspace, the stable workspace and
+        the resolver, so they are cached per agent until the workspace changes.
+        """
         if self._stable_workspace is None:
             raise WorkspaceError("CairnWorkspaceService is not initialized")
 
+        cached = self._externals_cache.get(agent_id)
+        if cached is not None and cached[0] is agent_workspace:
+            return cached[1]
+
         externals = CairnExternals(
             agent_id=agent_id,
             agent_fs=agent_workspace.cairn,
             stable_fs=self._stable_workspace,
             resolver=self._resolver,
-        )
-        return externals.as_externals()
+        ).as_externals()
+        self._externals_cache[agent_id] = (agent_workspace, externals)
+        return externals
 
     async def close(self) -> None:
         """Close all tracked workspaces."""
@@ -218,35 +309,44 @@ class CairnWorkspaceService:
         read_failures = 0
         write_failures = 0
         top_level_counts: dict[str, int] = {}
+        sync_index = await self._load_sync_index()
+        # Every file still on disk; index entries outside it are pruned on save.
+        seen_paths: set[str] = set()
+        pending: list[tuple[Path, str, tuple[int, int]]] = []
         last_progress_at = start
 
-        for dirpath, dirs, files in os.walk(self._project_root, topdown=True, followlinks=False):
-            dir_path = Path(dirpath)
+        # Walk with os.scandir so ignored directories are pruned by name before
+        # descent and Path objects are only built for files that get synced.
+        # Each frame carries its workspace-relative prefix and top-level root so
+        # file paths are derived by concatenation instead of relative_to calls.
+        stack: list[tuple[str, str, str | None]] = [(os.fspath(self._project_root), "", None)]
+        while stack:
+            dir_str, dir_rel_prefix, dir_top = stack.pop()
             try:
-                dir_rel_parts = dir_path.relative_to(self._project_root).parts
-            except ValueError:
-                skipped_outside += 1
-                dirs[:] = []
+                with os.scandir(dir_str) as it:
+                    entries = list(it)
+            except OSError as exc:
+                logger.debug("Failed to scan %s: %s", dir_str, exc)
                 continue
 
-            # Prune ignored directories before traversal to avoid scanning huge trees.
-            pruned = 0
-            keep_dirs: list[str] = []
-            for dname in dirs:
-                child_rel_parts = (*dir_rel_parts, dname)
-                if self._should_ignore_parts(child_rel_parts):
-                    pruned += 1
+            for entry in entries:
+                name = entry.name
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    continue
+
+                if is_dir:
+                    # Prune ignored directories before traversal to avoid scanning huge trees.
+                    if self._should_ignore_name(name):
+                        skipped_ignored += 1
+                        skipped_dirs += 1
+                    elif not entry.is_symlink():
+                        stack.append((entry.path, f"{dir_rel_prefix}{name}/", dir_top or name))
                     continue
-                keep_dirs.append(dname)
-            if pruned:
-                skipped_ignored += pruned
-                skipped_dirs += pruned
-            dirs[:] = keep_dirs
 
-            for fname in files:
                 scanned_files += 1
-                rel_parts = (*dir_rel_parts, fname)
-                top = rel_parts[0] if rel_parts else "."
+                top = dir_top or name
                 top_level_counts[top] = top_level_counts.get(top, 0) + 1
 
                 now = time.monotonic()
@@ -256,45 +356,100 @@ class CairnWorkspaceService:
                 ):
                     self._progress(
                         "sync progress "
-                        f"(elapsed_ms={(now - start) * 1000:.1f} scanned={scanned_files} synced={synced_files} "
-                        f"ignored={skipped_ignored} unchanged={skipped_unchanged} read_failures={read_failures} "
-                        f"write_failures={write_failures})"
+                        f"(elapsed_ms={(now - start) * 1000:.1f} scanned={scanned_files} pending={len(pending)} "
+                        f"ignored={skipped_ignored} unchanged={skipped_unchanged})"
                     )
                     last_progress_at = now
 
-                if self._should_ignore_parts(rel_parts):
+                if self._should_ignore_name(name):
                     skipped_ignored += 1
                     continue
 
-                path = dir_path / fname
-                if not self._resolver.is_within_project(path):
+                path = Path(entry.path)
+                is_symlink = entry.is_symlink()
+                # Only symlinked files can point outside the project; directory
+                # symlinks are never descended into.
+                if is_symlink and not self._resolver.is_within_project(path):
                     skipped_outside += 1
                     continue
 
-                # Incremental sync: skip files whose mtime hasn't changed
+                # Incremental sync: skip files whose mtime and size haven't changed
                 try:
-                    current_mtime = path.stat().st_mtime
+                    st = entry.stat()
                 except OSError:
                     continue
-                rel_path = self._resolver.to_workspace_path(path)
-                if self._file_mtimes.get(rel_path) == current_mtime:
+                signature = (st.st_mtime_ns, st.st_size)
+                rel_path = self._resolver.to_workspace_path(path) if is_symlink else dir_rel_prefix + name
+                seen_paths.add(rel_path)
+                if sync_index.get(rel_path) == signature:
                     skipped_unchanged += 1
                     continue
-
-                try:
-                    payload = path.read_bytes()
-                except OSError as exc:
-                    logger.debug("Failed to read %s: %s", path, exc)
-                    read_failures += 1
-                    continue
-
+                pending.append((path, rel_path, signature))
+
+        # Reader tasks pull file contents through worker threads and hand them
+        # to a single writer over a bounded queue. The stable workspace is one
+        # SQLite database, so writes are serialized in one place while disk
+        # reads keep overlapping with them.
+        stable_workspace = self._stable_workspace
+        queue: asyncio.Queue[tuple[str, bytes, tuple[int, int]] | None] = asyncio.Queue(
+            maxsize=SYNC_WRITE_QUEUE_SIZE
+        )
+        pending_iter = iter(pending)
+
+        def take_read_batch() -> list[tuple[Path, str, tuple[int, int]]]:
+            # Sizes come from the scan's stat signature; no await happens here,
+            # so readers never interleave while pulling from the shared iterator.
+            batch: list[tuple[Path, str, tuple[int, int]]] = []
+            batch_bytes = 0
+            for item in pending_iter:
+                batch.append(item)
+                batch_bytes += item[2][1]
+                if len(batch) >= SYNC_READ_BATCH_FILES or batch_bytes >= SYNC_READ_BATCH_BYTES:
+                    break
+            return batch
+
+        async def read_worker() -> None:
+            nonlocal read_failures
+            while batch := take_read_batch():
+                payloads = await asyncio.to_thread(_read_files, [path for path, _, _ in batch])
+                for (path, rel_path, signature), payload in zip(batch, payloads):
+                    if isinstance(payload, OSError):
+                        logger.debug("Failed to read %s: %s", path, payload)
+                        read_failures += 1
+                        continue
+                    await queue.put((rel_path, payload, signature))
+
+        async def write_worker() -> None:
+            nonlocal synced_files, write_failures
+            while (item := await queue.get()) is not None:
+                rel_path, payload, signature = item
                 try:
-                    await self._stable_workspace.files.write(rel_path, payload, mode="binary")
-                    self._file_mtimes[rel_path] = current_mtime
-                    synced_files += 1
+                    await stable_workspace.files.write(rel_path, payload, mode="binary")
                 except Exception as exc:
                     logger.debug("Failed to write %s to stable workspace: %s", rel_path, exc)
                     write_failures += 1
+                    continue
+                sync_index[rel_path] = signature
+                synced_files += 1
+
+        if pending:
+            readers = min(SYNC_CONCURRENCY, len(pending))
+            self._progress(f"sync writing {len(pending)} changed files (readers={readers})")
+            # A TaskGroup so any failure cancels the rest: readers blocked on a
+            # full queue would otherwise wait forever once the writer is gone.
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    tg.create_task(write_worker())
+                    await asyncio.wait([tg.create_task(read_worker()) for _ in range(readers)])
+                    await queue.put(None)
+            except BaseExceptionGroup as group:
+                raise group.exceptions[0]
+
+        stale_paths = sync_index.keys() - seen_paths
+        for rel_path in stale_paths:
+            del sync_index[rel_path]
+        if pending or stale_paths:
+            await self._save_sync_index()
 
         top_summary = ", ".join(
             f"{name}:{count}"
@@ -313,16 +468,22 @@ class CairnWorkspaceService:
 
         Reads the file from the project root and writes it into the stable
         workspace.  Returns ``False`` when the source file does not exist.
+        Concurrent callers for the same path share one in-flight sync.
         """
         rel_path = rel_path.lstrip("/")
         if not rel_path:
             return False
-        source = self._project_root / rel_path
-        if not source.exists():
-            return False
 
+        return await _single_flight(rel_path, self._file_sync_tasks, lambda: self._sync_file(rel_path))
+
+    async def _sync_file(self, rel_path: str) -> bool:
+        source = self._project_root / rel_path
         try:
-            payload = source.read_bytes()
+            # One worker-thread hop; a missing file surfaces as FileNotFoundError
+            # instead of needing a separate exists() check on the event loop.
+            payload = await asyncio.to_thread(source.read_bytes)
+        except FileNotFoundError:
+            return False
         except OSError as exc:
             logger.debug("ensure_file_synced: failed to read %s: %s", source, exc)
             return False
@@ -335,20 +496,18 @@ class CairnWorkspaceService:
 
         return True
 
-    def _should_ignore(self, path: Path) -> bool:
-        try:
-            rel_parts = path.relative_to(self._project_root).parts
-        except ValueError:
-            return True
-        return self._should_ignore_parts(rel_parts)
-
-    def _should_ignore_parts(self, rel_parts: tuple[str, ...]) -> bool:
-        for part in rel_parts:
-            if part in self._ignore_patterns:
-                return True
-            if self._ignore_dotfiles and part.startswith("."):
-                return True
-        return False
+    async def _load_sync_index(self) -> dict[str, tuple[int, int]]:
+        if self._sync_index_loaded:
+            return self._sync_index
+        self._sync_index_loaded = True
+        self._sync_index = await asyncio.to_thread(_read_sync_index, self._swarm_root / SYNC_INDEX_FILENAME)
+        return self._sync_index
+
+    async def _save_sync_index(self) -> None:
+        await asyncio.to_thread(_write_sync_index, self._swarm_root / SYNC_INDEX_FILENAME, dict(self._sync_index))
+
+    def _should_ignore_name(self, name: str) -> bool:
+        return name in self._ignore_patterns or (self._ignore_dotfiles and name.startswith("."))
 
     def _progress(self, message: str) -> None:
         logger.info("CairnWorkspaceService %s", message)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import time
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -181,7 +182,7 @@ async def build_turn_context(
     data_provider_cls: Any = CairnDataProvider,
     path_resolver_cls: Any = PathResolver,
     discover_grail_tools_fn: Any = discover_grail_tools,
-    build_virtual_fs_fn: Any = build_virtual_fs,
+    build_virtual_fs_fn: Callable[[Mapping[str, str | bytes]], dict[str, str | bytes]] = build_virtual_fs,
     build_prompt_fn: Any = _build_prompt,
 ) -> TurnContext:
     """Build workspace + prompt + tools for one agent turn."""
@@ -342,8 +343,7 @@ async def build_turn_context(
 
         async def files_provider() -> dict[str, str | bytes]:
             current_files = await data_provider.load_files(cst_node)
-            fs: dict[str, str | bytes] = dict(build_virtual_fs_fn(current_files))
-            return fs
+            return build_virtual_fs_fn(current_files)
 
         tools: list[Any] = []
         if manifest.agents_dir:
@@ -9,13 +9,16 @@ AgentFS currently updates inode ``atime`` on reads, so read and write
 operations both perform DB writes.  In practice, concurrent async operations
 against a single workspace can trigger ``database is locked`` errors under
 load.  This wrapper therefore serializes filesystem operations per workspace
-with ``asyncio.Lock`` for correctness.
+with ``asyncio.Lock`` for correctness.  The lock covers only the agent's own
+workspace; fallbacks to the shared stable workspace happen outside it.
 """
 
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import Any
@@ -25,6 +28,8 @@ from remora.utils import PathLike, PathResolver, normalize_path
 
 logger = logging.getLogger(__name__)
 
+EXISTS_CACHE_SIZE = 4096
+
 
 class AgentWorkspace:
     """Workspace for a single agent execution.
@@ -40,6 +45,7 @@ class AgentWorkspace:
         stable_workspace: Any | None = None,
         *,
         ensure_file_synced: Callable[[str], Awaitable[bool]] | None = None,
+        cache_exists: bool = True,
     ):
         self._workspace = workspace
         self._agent_id = agent_id
@@ -48,6 +54,10 @@ class AgentWorkspace:
         # AgentFS reads currently update inode atime, so reads and writes both
         # contend on the same DB. Serialize all filesystem operations per workspace.
         self._fs_lock = asyncio.Lock()
+        # LRU of paths known to exist. Only positive answers are cached: files
+        # can appear behind this wrapper (Grail write_file externals, on-demand
+        # stable syncs), but removal only happens through delete(), which evicts.
+        self._exists_cache: OrderedDict[str, None] | None = OrderedDict() if cache_exists else None
 
     @property
     def cairn(self) -> Any:
@@ -63,59 +73,90 @@ class AgentWorkspace:
             except Exception as exc:
                 if not _is_missing_file_error(exc) or self._stable_workspace is None:
                     raise
-            try:
-                return await self._stable_workspace.files.read(path_str, mode="text")
-            except Exception as exc:
-                if not _is_missing_file_error(exc):
-                    raise
 
-            if self._ensure_file_synced is not None:
+        # The lock guards this agent's DB only; the shared stable workspace is
+        # reached from every agent without it, so the fallback and on-demand
+        # sync run outside it rather than stalling this workspace's writes.
+        try:
+            return await self._stable_workspace.files.read(path_str, mode="text")
+        except Exception as exc:
+            if not _is_missing_file_error(exc):
+                raise
+
+        if self._ensure_file_synced is not None:
+            try:
+                synced = await self._ensure_file_synced(path_str)
+            except Exception:
+                synced = False
+            if synced:
                 try:
-                    synced = await self._ensure_file_synced(path_str)
-                except Exception:
-                    synced = False
-                if synced:
-                    try:
-                        return await self._stable_workspace.files.read(path_str, mode="text")
-                    except Exception as exc:
-                        if not _is_missing_file_error(exc):
-                            raise
-            raise FileNotFoundError(path_str)
+                    return await self._stable_workspace.files.read(path_str, mode="text")
+                except Exception as exc:
+                    if not _is_missing_file_error(exc):
+                        raise
+        raise FileNotFoundError(path_str)
 
     async def write(self, path: PathLike, content: str | bytes) -> None:
         """Write a file to the workspace (CoW isolated)."""
         path_str = _to_workspace_path(path)
         async with self._fs_lock:
             await self._workspace.files.write(path_str, content)
+            self._remember_exists(path_str)
 
     async def exists(self, path: PathLike) -> bool:
         """Check if a file exists in the workspace."""
         path_str = _to_workspace_path(path)
+        cache = self._exists_cache
+        if cache is not None and path_str in cache:
+            cache.move_to_end(path_str)
+            return True
+
         async with self._fs_lock:
             if await self._workspace.files.exists(path_str):
+                self._remember_exists(path_str)
                 return True
-            if self._stable_workspace is None:
-                return False
-            return await self._stable_workspace.files.exists(path_str)
+        if self._stable_workspace is None:
+            return False
+        # delete() only removes from the agent layer, so a stable hit stays
+        # valid after it and may be recorded outside the lock.
+        found = await self._stable_workspace.files.exists(path_str)
+        if found:
+            self._remember_exists(path_str)
+        return found
 
     async def list_dir(self, path: PathLike = ".") -> list[str]:
         """List directory entries in the workspace."""
         path_str = _to_workspace_path(path)
         async with self._fs_lock:
-            entries = set(await self._workspace.files.list_dir(path_str, output="name"))
-            if self._stable_workspace is not None:
-                try:
-                    stable_entries = await self._stable_workspace.files.list_dir(path_str, output="name")
-                except Exception:
-                    stable_entries = []
-                entries.update(stable_entries)
+            entries = await self._workspace.files.list_dir(path_str, output="name")
+        if self._stable_workspace is None:
             return sorted(entries)
+        try:
+            stable_entries = await self._stable_workspace.files.list_dir(path_str, output="name")
+        except Exception:
+            stable_entries = []
+        if not stable_entries:
+            return sorted(entries)
+        return sorted(set(entries).union(stable_entries))
 
     async def delete(self, path: PathLike) -> None:
         """Delete a file from the workspace."""
         path_str = _to_workspace_path(path)
         async with self._fs_lock:
             await self._workspace.files.remove(path_str)
+            # Evict under the lock, after the remove: agent-layer hits are only
+            # recorded under this lock, so none can land after the eviction.
+            if self._exists_cache is not None:
+                self._exists_cache.pop(path_str, None)
+
+    def _remember_exists(self, path_str: str) -> None:
+        cache = self._exists_cache
+        if cache is None:
+            return
+        cache[path_str] = None
+        cache.move_to_end(path_str)
+        if len(cache) > EXISTS_CACHE_SIZE:
+            cache.popitem(last=False)
 
     async def mkdir(self, path: PathLike) -> None:
         """Create a directory in the workspace.
@@ -137,40 +178,46 @@ class CairnDataProvider:
         self._resolver = resolver
 
     async def load_files(self, node: CSTNode, related: list[str] | None = None) -> dict[str, str]:
-        """Load target file and related files for Grail execution."""
+        """Load target file and related files for Grail execution.
+
+        All reads are issued together; a related file that cannot be read is
+        skipped, so no separate ``exists`` probe is needed per path.
+        """
         files: dict[str, str] = {}
         target_path = self._resolver.to_workspace_path(node.file_path)
 
-        try:
-            content = await self._workspace.read(target_path)
-            files[target_path] = content
-            if node.file_path != target_path:
-                files[node.file_path] = content
-        except Exception as e:
-            fallback_content = self._load_from_disk(node.file_path)
+        related_paths: list[tuple[str, str]] = []
+        for path in related or ():
+            try:
+                related_paths.append((path, self._resolver.to_workspace_path(path)))
+            except Exception as e:
+                logger.debug("Could not load related file %s: %s", path, e)
+
+        target_result, *related_results = await asyncio.gather(
+            self._workspace.read(target_path),
+            *(self._workspace.read(workspace_path) for _, workspace_path in related_paths),
+            return_exceptions=True,
+        )
+
+        if isinstance(target_result, BaseException):
+            fallback_content = await asyncio.to_thread(self._load_from_disk, node.file_path)
             if fallback_content is not None:
-                files[target_path] = fallback_content
-                if node.file_path != target_path:
-                    files[node.file_path] = fallback_content
+                _store_file(files, target_path, node.file_path, fallback_content)
                 logger.debug(
                     "Loaded %s directly from disk after workspace miss: %s",
                     node.file_path,
                     target_path,
                 )
             else:
-                logger.warning("Could not load target file %s: %s", node.file_path, e)
+                logger.warning("Could not load target file %s: %s", node.file_path, target_result)
+        else:
+            _store_file(files, target_path, node.file_path, target_result)
 
-        if related:
-            for path in related:
-                try:
-                    workspace_path = self._resolver.to_workspace_path(path)
-                    if await self._workspace.exists(workspace_path):
-                        content = await self._workspace.read(workspace_path)
-                        files[workspace_path] = content
-                        if path != workspace_path:
-                            files[path] = content
-                except Exception as e:
-                    logger.debug("Could not load related file %s: %s", path, e)
+        for (path, workspace_path), result in zip(related_paths, related_results):
+            if isinstance(result, BaseException):
+                logger.debug("Could not load related file %s: %s", path, result)
+                continue
+            _store_file(files, workspace_path, path, result)
 
         return files
 
@@ -195,6 +242,13 @@ __all__ = [
 ]
 
 
+def _store_file(files: dict[str, str], workspace_path: str, path: str, content: str) -> None:
+    """Key content by its workspace path and, when it differs, the caller's path."""
+    files[workspace_path] = content
+    if path != workspace_path:
+        files[path] = content
+
+
 def _is_missing_file_error(exc: Exception) -> bool:
     if isinstance(exc, FileNotFoundError):
         return True
@@ -210,6 +264,7 @@ def _is_missing_file_error(exc: Exception) -> bool:
     return errno_value == 2
 
 
+@functools.lru_cache(maxsize=8192)
 def _to_workspace_path(path: PathLike) -> str:
     """Normalize path input to AgentFS workspace-relative paths."""
     raw = normalize_path(path).as_posix()
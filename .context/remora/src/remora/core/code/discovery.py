@@ -6,10 +6,13 @@ and returns CSTNode objects representing functions, classes, files, etc.
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import importlib.resources
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Iterator
 
@@ -89,8 +92,9 @@ def _get_query_dir() -> Path:
     return Path(importlib.resources.files("remora")) / "ts_queries"  # type: ignore[arg-type]
 
 
+@functools.cache
 def _load_queries(language: str, query_pack: str = "remora_core") -> str | None:
-    """Load tree-sitter query from .scm file."""
+    """Load tree-sitter query from .scm files (read once per language and pack)."""
     query_dir = _get_query_dir()
 
     # Try language-specific query pack
@@ -110,49 +114,88 @@ def _load_queries(language: str, query_pack: str = "remora_core") -> str | None:
 # ============================================================================
 
 
-def _get_parser(language: str) -> Parser | None:
-    """Get a tree-sitter parser for the given language."""
+@functools.cache
+def _get_language(language: str) -> Language | None:
+    """Get the tree-sitter Language for *language*, loading it once per process."""
     try:
         # Language libraries are named like tree_sitter_python
         lang_module = __import__(f"tree_sitter_{language}")
-        lang = Language(lang_module.language())
-        parser = Parser(lang)
-        return parser
+        return Language(lang_module.language())
     except (ImportError, AttributeError) as e:
         logger.debug("Could not load parser for %s: %s", language, e)
         return None
 
 
+# Parsers hold per-parse state and are not thread-safe, so discover()'s
+# worker threads each keep their own parser per language.
+_thread_local = threading.local()
+
+
+def _get_parser(language: str) -> Parser | None:
+    """Get a tree-sitter parser for the given language."""
+    parsers: dict[str, Parser] | None = getattr(_thread_local, "parsers", None)
+    if parsers is None:
+        parsers = _thread_local.parsers = {}
+    parser = parsers.get(language)
+    if parser is None:
+        lang = _get_language(language)
+        if lang is None:
+            return None
+        parser = parsers[language] = Parser(lang)
+    return parser
+
+
+def _get_query(language: str) -> Query | None:
+    """Get the compiled remora_core query for *language*, compiling it once per thread."""
+    queries: dict[str, Query | None] | None = getattr(_thread_local, "queries", None)
+    if queries is None:
+        queries = _thread_local.queries = {}
+    if language in queries:
+        return queries[language]
+
+    query: Query | None = None
+    query_text = _load_queries(language)
+    if query_text is not None:
+        try:
+            query = Query(_get_language(language), query_text)
+        except Exception as e:
+            logger.warning("Query error for %s: %s", language, e)
+    queries[language] = query
+    return query
+
+
 NAME_CAPTURE_SUFFIXES = (".name", ".lang")
 
 # Captures that are handled by language-specific post-processing, not the generic pipeline.
 _POSTPROCESS_CAPTURES = frozenset({"frontmatter.def"})
 
 
-def _parse_nodes(file_path: str, content: str, language: str) -> list[CSTNode]:
-    """Common parsing logic used by both file and content parsing."""
+def _parse_nodes(file_path: str, content: str, language: str, source: bytes | None = None) -> list[CSTNode]:
+    """Common parsing logic used by both file and content parsing.
+
+    *source* is the UTF-8 encoding of *content* when the caller already has
+    it. tree-sitter offsets are byte offsets, so node text is sliced from
+    the bytes rather than from the decoded string.
+    """
+    if source is None:
+        source = content.encode()
+
     parser = _get_parser(language)
     if parser is None:
-        return [_create_file_node(file_path, content)]
+        return [_create_file_node(file_path, content, source)]
 
-    tree = parser.parse(content.encode())
+    tree = parser.parse(source)
 
     # Load and apply queries
-    query_text = _load_queries(language)
-    if query_text is None:
-        return [_create_file_node(file_path, content)]
-
-    try:
-        lang_module = __import__(f"tree_sitter_{language}")
-        lang = Language(lang_module.language())
-        query = Query(lang, query_text)
-    except Exception as e:
-        logger.warning("Query error for %s: %s", language, e)
-        return [_create_file_node(file_path, content)]
+    query = _get_query(language)
+    if query is None:
+        return [_create_file_node(file_path, content, source)]
 
     # Extract matches
     nodes: list[CSTNode] = []
+    has_file_node = False
     captures = _collect_captures(query, tree.root_node)
+    capture_names = _index_capture_names(captures)
 
     for node, capture_name in captures:
         if capture_name.endswith(NAME_CAPTURE_SUFFIXES):
@@ -161,16 +204,20 @@ def _parse_nodes(file_path: str, content: str, language: str) -> list[CSTNode]:
             continue  # Handled by language-specific post-processing
 
         node_type = capture_name.split(".", 1)[0]
-        name = _extract_name(node, captures)
+        if node_type == "file":
+            has_file_node = True
+        name = _extract_name(node, capture_names)
         full_name = f"{node_type}:{name}"
 
         cst_node = CSTNode(
-            node_id=compute_node_id(file_path, node_type, full_name),
+            # Placeholder: _assign_semantic_identity derives the real id from the
+            # containment-based full_name, so hashing the interim name is wasted.
+            node_id="",
             node_type=node_type,
             name=name,
             full_name=full_name,
             file_path=file_path,
-            text=content[node.start_byte : node.end_byte],
+            text=source[node.start_byte : node.end_byte].decode("utf-8", errors="replace"),
             start_line=node.start_point[0] + 1,
             end_line=node.end_point[0] + 1,
             start_byte=node.start_byte,
@@ -181,11 +228,12 @@ def _parse_nodes(file_path: str, content: str, language: str) -> list[CSTNode]:
     # Markdown post-processing: create note/todo-note from frontmatter
     if language == "markdown":
         path_obj = Path(file_path)
-        nodes = _postprocess_markdown(path_obj, content, captures, nodes)
+        nodes = _postprocess_markdown(path_obj, content, source, captures, nodes)
 
-    # Always include file-level node
-    if not any(n.node_type == "file" for n in nodes):
-        nodes.insert(0, _create_file_node(file_path, content))
+    # Always include file-level node (markdown post-processing only adds
+    # note/todo nodes, so the flag from the capture loop still holds).
+    if not has_file_node:
+        nodes.insert(0, _create_file_node(file_path, content, source))
 
     # Deduplicate: when both "function" and "method" exist for the same
     # (name, start_line, end_line), keep only "method".
@@ -203,17 +251,23 @@ def _parse_nodes(file_path: str, content: str, language: str) -> list[CSTNode]:
 def _parse_file(file_path: Path, language: str) -> list[CSTNode]:
     """Parse a single file and extract nodes using tree-sitter queries."""
     try:
-        content = file_path.read_text(encoding="utf-8")
+        source = file_path.read_bytes()
+        if b"\r" in source:
+            # Match read_text()'s universal-newline translation so CRLF files
+            # keep the same node text, byte offsets and source hashes.
+            source = source.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        content = source.decode("utf-8")
     except (OSError, UnicodeDecodeError) as e:
         logger.warning("Could not read %s: %s", file_path, e)
         return []
 
-    return _parse_nodes(str(file_path), content, language)
+    return _parse_nodes(str(file_path), content, language, source)
 
 
 def _postprocess_markdown(
     file_path: Path,
     content: str,
+    source: bytes,
     captures: list[tuple[tree_sitter.Node, str]],
     nodes: list[CSTNode],
 ) -> list[CSTNode]:
@@ -229,7 +283,7 @@ def _postprocess_markdown(
         return nodes
 
     # Parse YAML from frontmatter text (strip --- delimiters)
-    raw_text = content[frontmatter_node.start_byte : frontmatter_node.end_byte]
+    raw_text = source[frontmatter_node.start_byte : frontmatter_node.end_byte].decode("utf-8", errors="replace")
     yaml_text = raw_text.strip().removeprefix("---").removesuffix("---").strip()
 
     metadata: dict = {}
@@ -249,7 +303,7 @@ def _postprocess_markdown(
     full_name = f"{node_type}:{name}"
 
     line_count = content.count("\n") + 1 if content else 1
-    byte_length = len(content.encode("utf-8")) if content else 0
+    byte_length = len(source)
 
     note_node = CSTNode(
         node_id=compute_node_id(str(file_path), node_type, full_name),
@@ -289,22 +343,31 @@ def _collect_captures(query: tree_sitter.Query, root: tree_sitter.Node) -> list[
     return list(captures)
 
 
-def _is_ancestor(ancestor: tree_sitter.Node, descendant: tree_sitter.Node) -> bool:
-    """Check if *ancestor* is an ancestor of *descendant* (walking up parents)."""
-    current = descendant.parent
-    while current is not None:
-        if current.id == ancestor.id:
-            return True
-        current = current.parent
-    return False
+def _index_capture_names(captures: list[tuple[tree_sitter.Node, str]]) -> dict[int, str]:
+    """Map each node id to the first ``.name``/``.lang`` capture beneath it.
 
+    Every name capture is credited to all of its ancestors, not just its
+    direct parent, in capture order, so lookups match what a per-node scan
+    of *captures* would find while touching each capture only once.
+    """
+    names: dict[int, str] = {}
+    for n, capture_name in captures:
+        if not capture_name.endswith(NAME_CAPTURE_SUFFIXES):
+            continue
+        text = n.text.decode() if n.text else "unknown"
+        current = n.parent
+        while current is not None:
+            names.setdefault(current.id, text)
+            current = current.parent
+    return names
 
-def _extract_name(node: tree_sitter.Node, captures: list) -> str:
+
+def _extract_name(node: tree_sitter.Node, capture_names: dict[int, str]) -> str:
     """Extract the name for a captured node."""
-    # Look for corresponding .name capture — walk ancestors, not just direct parent.
-    for n, name in captures:
-        if name.endswith(NAME_CAPTURE_SUFFIXES) and _is_ancestor(node, n):
-            return n.text.decode() if n.text else "unknown"
+    # Corresponding .name capture anywhere beneath the node, not just a direct child.
+    name = capture_names.get(node.id)
+    if name is not None:
+        return name
 
     # Try common child names
     for child in node.children:
@@ -314,8 +377,12 @@ def _extract_name(node: tree_sitter.Node, captures: list) -> str:
     return "unknown"
 
 
-def _create_file_node(file_path: Path | str, content: str | None = None) -> CSTNode:
-    """Create a file-level CSTNode from path, optionally with memory content."""
+def _create_file_node(file_path: Path | str, content: str | None = None, source: bytes | None = None) -> CSTNode:
+    """Create a file-level CSTNode from path, optionally with memory content.
+
+    Pass *source* (the UTF-8 bytes of *content*) when available to avoid
+    re-encoding the file just to measure its byte length.
+    """
     path_str = str(file_path)
     path_obj = Path(file_path)
     if content is None:
@@ -325,7 +392,10 @@ def _create_file_node(file_path: Path | str, content: str | None = None) -> CSTN
             content = ""
 
     line_count = content.count("\n") + 1 if content else 1
-    byte_length = len(content.encode("utf-8")) if content else 0
+    if source is not None:
+        byte_length = len(source)
+    else:
+        byte_length = len(content.encode("utf-8")) if content else 0
     return CSTNode(
         node_id=compute_node_id(path_str, "file", path_obj.stem),
         node_type="file",
@@ -437,7 +507,7 @@ def discover(
     paths: list[PathLike],
     languages: list[str] | None = None,
     node_types: list[str] | None = None,
-    max_workers: int = 4,
+    max_workers: int | None = None,
 ) -> list[CSTNode]:
     """Scan source paths with tree-sitter and return discovered nodes.
 
@@ -448,12 +518,17 @@ def discover(
         paths: Files or directories to scan
         languages: Limit to specific languages (by extension, e.g. "python")
         node_types: Filter to specific node types ("function", "class", etc.)
-        max_workers: Thread pool size for parallel parsing
+        max_workers: Thread pool size for parallel parsing. Defaults to the
+            CPU count, since tree-sitter releases the GIL while parsing.
 
     Returns:
         List of CSTNode objects sorted by file path and line number
     """
     path_list = [normalize_path(p) for p in paths]
+    suffix_languages = {
+        suffix: lang for suffix, lang in LANGUAGE_EXTENSIONS.items() if languages is None or lang in languages
+    }
+    allowed_suffixes = frozenset(suffix_languages)
 
     files: list[tuple[Path, str]] = []
     for path in path_list:
@@ -462,21 +537,21 @@ def discover(
             if lang and (languages is None or lang in languages):
                 files.append((path, lang))
         elif path.is_dir():
-            for file_path in _walk_directory(path):
-                lang = _detect_language(file_path)
-                if lang and (languages is None or lang in languages):
-                    files.append((file_path, lang))
+            # The walk only yields allowed suffixes, so the language is known.
+            for file_path in _walk_directory(path, allowed_suffixes=allowed_suffixes):
+                files.append((file_path, suffix_languages[file_path.suffix.lower()]))
 
     all_nodes: list[CSTNode] = []
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [executor.submit(_parse_file, file_path, lang) for file_path, lang in files]
-        for future in futures:
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count() or 8) as executor:
+        futures = {executor.submit(_parse_file, file_path, lang): file_path for file_path, lang in files}
+        # Collect in completion order so one slow file does not hold back the
+        # rest; the final sort below restores a deterministic order.
+        for future in as_completed(futures):
             try:
-                nodes = future.result()
-                all_nodes.extend(nodes)
+                all_nodes.extend(future.result())
             except Exception as e:
-                logger.warning("Parse error: %s", e)
+                logger.warning("Parse error in %s: %s", futures[future], e)
 
     if node_types:
         all_nodes = [n for n in all_nodes if n.node_type in node_types]
@@ -495,18 +570,30 @@ def _walk_directory(
     directory: Path,
     *,
     ignore_patterns: set[str] | None = None,
+    allowed_suffixes: frozenset[str] | None = None,
 ) -> Iterator[Path]:
-    """Recursively walk directory, skipping hidden and common ignore patterns."""
+    """Recursively walk directory, skipping hidden and common ignore patterns.
+
+    Uses ``os.scandir`` so file-type checks come from the directory read
+    instead of a separate ``stat`` per entry. When *allowed_suffixes* is
+    given, files with other extensions are dropped before any type check.
+    """
     if ignore_patterns is None:
         ignore_patterns = {".git", ".venv", "venv", "node_modules", "__pycache__", ".tox"}
 
-    for item in directory.iterdir():
-        if item.name.startswith(".") or item.name in ignore_patterns:
-            continue
-        if item.is_file():
-            yield item
-        elif item.is_dir():
-            yield from _walk_directory(item, ignore_patterns=ignore_patterns)
+    stack: list[str | Path] = [directory]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith(".") or name in ignore_patterns:
+                    continue
+                if entry.is_dir():
+                    stack.append(entry.path)
+                elif (
+                    allowed_suffixes is None or os.path.splitext(name)[1].lower() in allowed_suffixes
+                ) and entry.is_file():
+                    yield Path(entry.path)
 
 
 def parse_file(file_path: PathLike) -> list[CSTNode]:
@@ -9,6 +9,7 @@ import logging
 import sqlite3
 import time
 from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, is_dataclass
 from typing import TYPE_CHECKING, Any, TypeVar
 
@@ -22,6 +23,16 @@ from remora.utils import PathLike, normalize_path
 logger = logging.getLogger(__name__)
 
 _NOISY_EVENT_TYPES = frozenset({"NodeDiscoveredEvent", "ScaffoldRequestEvent"})
+REPLAY_BATCH_SIZE = 1000
+# ``json.dumps(..., default=str)`` builds a fresh encoder on every call.
+_encode_event_json = json.JSONEncoder(default=str).encode
+# A single statement string so sqlite3's per-connection statement cache
+# reuses one prepared INSERT for append() and batch_append().
+_INSERT_EVENT_SQL = (
+    "INSERT INTO events (graph_id, event_type, payload, timestamp, created_at,"
+    " agent_id, from_agent, to_agent, correlation_id, tags)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
 _T = TypeVar("_T")
 
 if TYPE_CHECKING:
@@ -47,6 +58,12 @@ class EventStore:
         self._conn: sqlite3.Connection | None = None
         self._read_conn: sqlite3.Connection | None = None  # Separate connection for reads
         self._lock = asyncio.Lock()
+        # Calls on the writer connection (EventStore and NodeStore writes,
+        # checkpoints, close) are dispatched to this one thread, so writes skip
+        # the shared default executor. Only the best-effort finalizer in
+        # _close_sync touches the connection from another thread. Created in
+        # initialize().
+        self._writer_executor: ThreadPoolExecutor | None = None
         # Serializes concurrent asyncio.to_thread dispatches against _read_conn.
         # SQLite connections are NOT thread-safe even in WAL mode; concurrent
         # to_thread() calls against the same connection corrupt its internal
@@ -86,7 +103,7 @@ class EventStore:
         if self._node_store is not None:
             self._node_store.bind_read_lock(self._read_lock)
             if self._conn is not None:
-                self._node_store.bind_write_backend(self._conn, self._lock)
+                self._node_store.bind_write_backend(self._conn, self._lock, self._writer_executor)
 
     async def initialize(self) -> None:
         """Initialize the database and create tables."""
@@ -96,7 +113,12 @@ class EventStore:
             # Use a very short timeout (100ms) so we fail fast and can retry quickly.
             # SQLite write contention is expected during background scan, so we
             # want operations to fail/retry quickly rather than blocking.
-            self._conn = await asyncio.to_thread(
+            if self._writer_executor is None:
+                self._writer_executor = ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix="remora-eventstore-writer",
+                )
+            self._conn = await self._run_on_writer(
                 sqlite3.connect,
                 str(self._db_path),
                 timeout=0.1,
@@ -106,10 +128,11 @@ class EventStore:
             self._conn.row_factory = sqlite3.Row
 
             # Enable WAL mode for better concurrent read/write performance
-            await asyncio.to_thread(self._conn.execute, "PRAGMA journal_mode=WAL")
-            await asyncio.to_thread(self._conn.execute, "PRAGMA synchronous=NORMAL")
+            await self._run_on_writer(self._conn.execute, "PRAGMA journal_mode=WAL")
+            await self._run_on_writer(self._conn.execute, "PRAGMA synchronous=NORMAL")
             # Keep WAL growth bounded even when no explicit checkpoint runs.
-            await asyncio.to_thread(self._conn.execute, "PRAGMA wal_autocheckpoint=1000")
+            await self._run_on_writer(self._conn.execute, "PRAGMA wal_autocheckpoint=1000")
+            await self._run_on_writer(self._conn.execute, "PRAGMA temp_store=MEMORY")
 
             # Create a separate read-only connection for queries.
             # With WAL mode, readers don't block writers and vice versa.
@@ -126,7 +149,7 @@ class EventStore:
             # Mark read connection as read-only via query_only pragma
             await asyncio.to_thread(self._read_conn.execute, "PRAGMA query_only=ON")
 
-            await asyncio.to_thread(store_schema.create_tables, self._conn)
+            await self._run_on_writer(store_schema.create_tables, self._conn)
             await self._migrate_routing_fields()
 
             from remora.core.store.node_store import NodeStore
@@ -135,6 +158,7 @@ class EventStore:
                 read_lock=self._read_lock,
                 write_conn=self._conn,
                 write_lock=self._lock,
+                write_executor=self._writer_executor,
             )
 
             if self._subscriptions is not None:
@@ -168,8 +192,13 @@ class EventStore:
             db_path=self._db_path,
             conn=self._conn,
             log=logger,
+            executor=self._writer_executor,
         )
 
+    async def _run_on_writer(self, func: Callable[..., _T], /, *args: Any, **kwargs: Any) -> _T:
+        """Run a blocking call against the writer connection on its dedicated thread."""
+        return await store_connection.run_on_executor(self._writer_executor, func, *args, **kwargs)
+
     def _log_event_routing(self, event_type: str, to_agent: str | None, matching_agents: list[str]) -> None:
         """Emit high-volume routing logs at DEBUG while keeping user-facing events at INFO."""
         log_fn = logger.debug if event_type in _NOISY_EVENT_TYPES else logger.info
@@ -184,7 +213,7 @@ class EventStore:
     async def _migrate_routing_fields(self) -> None:
         """Add routing fields to existing tables."""
         assert self._conn is not None, "_migrate_routing_fields called before connection"
-        await asyncio.to_thread(store_schema.migrate, self._conn)
+        await self._run_on_writer(store_schema.migrate, self._conn)
 
 
 
@@ -219,10 +248,7 @@ class EventStore:
             self._begin_immediate_with_recovery("append")
             try:
                 with contextlib.closing(self._conn.execute(
-                    """
-                    INSERT INTO events (graph_id, event_type, payload, timestamp, created_at, agent_id, from_agent, to_agent, correlation_id, tags)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
+                    _INSERT_EVENT_SQL,
                     (
                         graph_id,
                         event_type,
@@ -301,11 +327,12 @@ class EventStore:
                 StructuredEvent | CoreEvent,
             ]
         ] = []
+        # One clock read for the whole batch; the rows commit together anyway.
+        created_at = time.time()
         for event in events:
             event_type = getattr(event, "event_type", None) or type(event).__name__
             payload = self._serialize_event(event)
-            timestamp = getattr(event, "timestamp", time.time())
-            created_at = time.time()
+            timestamp = getattr(event, "timestamp", created_at)
             agent_id = getattr(event, "agent_id", None)
             from_agent = getattr(event, "from_agent", None)
             to_agent = getattr(event, "to_agent", None)
@@ -346,10 +373,7 @@ class EventStore:
                     event,
                 ) in prepared:
                     with contextlib.closing(self._conn.execute(
-                        """
-                        INSERT INTO events (graph_id, event_type, payload, timestamp, created_at, agent_id, from_agent, to_agent, correlation_id, tags)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
+                        _INSERT_EVENT_SQL,
                         (
                             graph_id,
                             event_type,
@@ -416,25 +440,40 @@ class EventStore:
         until: float | None = None,
         after_id: int | None = None,
     ) -> AsyncIterator[dict[str, Any]]:
-        """Replay events for a graph."""
+        """Replay events for a graph.
+
+        Rows are fetched in pages of ``REPLAY_BATCH_SIZE`` so memory stays
+        bounded by the page, not the graph's event count. The read lock is
+        released between pages so other readers are not starved by a slow
+        consumer.
+        """
         if self._read_conn is None:
             await self.initialize()
         if self._read_conn is None:
             raise RuntimeError("EventStore not initialized")
 
-        async with self._read_lock:
-            rows = await asyncio.to_thread(
-                store_queries.fetch_replay_rows,
-                self._read_conn,
-                graph_id=graph_id,
-                event_types=event_types,
-                since=since,
-                until=until,
-                after_id=after_id,
-            )
+        after_key: tuple[float, int] | None = None
+        while True:
+            async with self._read_lock:
+                rows = await asyncio.to_thread(
+                    store_queries.fetch_replay_rows,
+                    self._read_conn,
+                    graph_id=graph_id,
+                    event_types=event_types,
+                    since=since,
+                    until=until,
+                    after_id=after_id,
+                    after_key=after_key,
+                    limit=REPLAY_BATCH_SIZE,
+                )
+
+            for row in rows:
+                yield self._row_to_dict(row)
 
-        for row in rows:
-            yield self._row_to_dict(row)
+            if len(rows) < REPLAY_BATCH_SIZE:
+                break
+            last = rows[-1]
+            after_key = (last["timestamp"], last["id"])
 
     async def get_agent_timeline(
         self,
@@ -570,7 +609,7 @@ class EventStore:
         if self._conn is None:
             raise RuntimeError("EventStore not initialized")
         async with self._lock:
-            return await asyncio.to_thread(
+            return await self._run_on_writer(
                 store_queries.delete_graph_events,
                 self._conn,
                 graph_id=graph_id,
@@ -588,7 +627,7 @@ class EventStore:
             raise ValueError(f"Unsupported checkpoint mode: {mode}")
 
         async with self._lock:
-            result = await asyncio.to_thread(
+            result = await self._run_on_writer(
                 store_queries.checkpoint_wal,
                 self._conn,
                 mode_upper=mode_upper,
@@ -608,12 +647,14 @@ class EventStore:
         if self._conn:
             async with self._lock:
                 try:
-                    with contextlib.closing(self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")) as cursor:
-                        cursor.fetchone()
+                    await self._run_on_writer(store_queries.checkpoint_wal, self._conn, mode_upper="TRUNCATE")
                 except Exception:
                     logger.debug("close: wal checkpoint failed", exc_info=True)
-                await asyncio.to_thread(self._conn.close)
+                await self._run_on_writer(self._conn.close)
                 self._conn = None
+        if self._writer_executor is not None:
+            self._writer_executor.shutdown(wait=False)
+            self._writer_executor = None
         if self._read_conn:
             await asyncio.to_thread(self._read_conn.close)
             self._read_conn = None
@@ -624,7 +665,9 @@ class EventStore:
         """Best-effort synchronous cleanup used by the finalizer path."""
         conn = self._conn
         read_conn = self._read_conn
+        writer_executor = self._writer_executor
         self._conn = None
+        self._writer_executor = None
         self._read_conn = None
         self._node_store = None
         self._trigger_queue = None
@@ -635,6 +678,8 @@ class EventStore:
         if read_conn is not None:
             with contextlib.suppress(Exception):
                 read_conn.close()
+        if writer_executor is not None:
+            writer_executor.shutdown(wait=False)
 
     def __del__(self) -> None:
         # Finalizer safeguard for tests that forget to await close().
@@ -652,7 +697,7 @@ class EventStore:
         else:
             data = {"value": str(event)}
 
-        return json.dumps(data, default=str)
+        return _encode_event_json(data)
 
 
 __all__ = ["EventStore"]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import os
 import random
@@ -10,6 +11,7 @@ import sqlite3
 import subprocess
 import threading
 from collections.abc import Callable
+from concurrent.futures import Executor
 from pathlib import Path
 from typing import Any, TypeVar
 
@@ -92,6 +94,14 @@ def begin_immediate_with_recovery(
     conn.execute("BEGIN IMMEDIATE")
 
 
+async def run_on_executor(executor: Executor | None, func: Callable[..., _T], /, *args: Any, **kwargs: Any) -> _T:
+    """Run a blocking call on ``executor``, or on ``asyncio.to_thread`` when it is None."""
+    if executor is None:
+        return await asyncio.to_thread(func, *args, **kwargs)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+
 async def run_locked_write_with_retries(
     op_name: str,
     op: Callable[[], _T],
@@ -100,13 +110,23 @@ async def run_locked_write_with_retries(
     db_path: Path,
     conn: sqlite3.Connection | None,
     log: logging.Logger,
+    executor: Executor | None = None,
 ) -> _T:
-    """Run write op under the store lock with lock retries and cancel-safe completion."""
+    """Run write op under the store lock with lock retries and cancel-safe completion.
+
+    When ``executor`` is given the op runs there instead of on the default
+    ``asyncio.to_thread`` pool.
+    """
     max_attempts = LOCK_RETRY_MAX_ATTEMPTS
+    loop = asyncio.get_running_loop()
     for attempt in range(max_attempts):
         try:
             async with lock:
-                write_task = asyncio.create_task(asyncio.to_thread(op))
+                write_task: asyncio.Future[_T]
+                if executor is None:
+                    write_task = asyncio.create_task(asyncio.to_thread(op))
+                else:
+                    write_task = loop.run_in_executor(executor, op)
                 try:
                     return await asyncio.shield(write_task)
                 except asyncio.CancelledError:
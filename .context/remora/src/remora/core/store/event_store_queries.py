@@ -8,14 +8,10 @@ import sqlite3
 from typing import Any
 
 
-def row_to_event_dict(row: sqlite3.Row) -> dict[str, Any]:
-    tags = row["tags"]
-    if tags:
-        tags = json.loads(tags)
-
-    stored = json.loads(row["payload"])
-    event_type = stored.get("event_type") or row["event_type"]
-    meta_keys = {
+# Keys of a stored event blob that are surfaced at the top level of the event
+# dict rather than folded into its ``payload``.
+_EVENT_META_KEYS = frozenset(
+    {
         "event_id",
         "event_type",
         "timestamp",
@@ -30,14 +26,23 @@ def row_to_event_dict(row: sqlite3.Row) -> dict[str, Any]:
         "created_at",
         "id",
     }
+)
+
+
+def row_to_event_dict(row: sqlite3.Row) -> dict[str, Any]:
+    tags = row["tags"]
+    if tags:
+        tags = json.loads(tags)
 
+    stored = json.loads(row["payload"])
+    event_type = stored.get("event_type") or row["event_type"]
     nested_payload: dict[str, Any] = {}
     original_payload = stored.get("payload")
     if isinstance(original_payload, dict) and original_payload:
         nested_payload.update(original_payload)
 
     for key, value in stored.items():
-        if key not in meta_keys and value not in (None, "", {}, []):
+        if key not in _EVENT_META_KEYS and value not in (None, "", {}, []):
             nested_payload[key] = value
 
     return {
@@ -64,7 +69,15 @@ def fetch_replay_rows(
     since: float | None = None,
     until: float | None = None,
     after_id: int | None = None,
+    after_key: tuple[float, int] | None = None,
+    limit: int | None = None,
 ) -> list[sqlite3.Row]:
+    """Fetch replay rows ordered by (timestamp, id).
+
+    ``after_key`` is the (timestamp, id) of the last row already seen, which
+    lets callers page through a replay with ``limit`` without holding a
+    cursor open between pages.
+    """
     query = "SELECT * FROM events WHERE graph_id = ?"
     params: list[Any] = [graph_id]
 
@@ -82,7 +95,16 @@ def fetch_replay_rows(
         query += " AND id > ?"
         params.append(after_id)
 
+    if after_key is not None:
+        # The leading ``timestamp >= ?`` gives SQLite a range it can seek on
+        # idx_events_graph_timestamp, so each page starts where the last ended.
+        query += " AND timestamp >= ? AND (timestamp > ? OR id > ?)"
+        params.extend((after_key[0], after_key[0], after_key[1]))
+
     query += " ORDER BY timestamp ASC, id ASC"
+    if limit is not None:
+        query += " LIMIT ?"
+        params.append(limit)
     with contextlib.closing(conn.execute(query, params)) as cursor:
         return cursor.fetchall()
 
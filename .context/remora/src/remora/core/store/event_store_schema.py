@@ -52,6 +52,9 @@ def create_tables(conn: sqlite3.Connection) -> None:
         CREATE INDEX IF NOT EXISTS idx_events_graph_id
         ON events(graph_id);
 
+        CREATE INDEX IF NOT EXISTS idx_events_graph_timestamp
+        ON events(graph_id, timestamp, id);
+
         CREATE INDEX IF NOT EXISTS idx_events_type
         ON events(event_type);
 
@@ -7,8 +7,10 @@ import contextlib
 import json
 import sqlite3
 import uuid
+from concurrent.futures import Executor
 from typing import Any
 
+import remora.core.store.event_store_connection as store_connection
 import remora.core.store.event_store_queries as store_queries
 from remora.core.agents.agent_node import AgentNode
 
@@ -66,6 +68,7 @@ class NodeStore:
         read_lock: asyncio.Lock,
         write_conn: sqlite3.Connection | None = None,
         write_lock: asyncio.Lock | None = None,
+        write_executor: Executor | None = None,
     ):
         """Initialize the NodeStore with read access to the database.
 
@@ -73,16 +76,25 @@ class NodeStore:
             read_conn: A dedicated read-only SQLite connection.
             read_lock: An asyncio.Lock that serializes concurrent to_thread
                        accesses against the read connection.
+            write_executor: Executor owning the write connection. When set,
+                       node mutations run there instead of on to_thread workers.
         """
         self._read_conn = read_conn
         self._read_lock = read_lock
         self._write_conn = write_conn
         self._write_lock = write_lock
+        self._write_executor = write_executor
 
-    def bind_write_backend(self, conn: sqlite3.Connection, lock: asyncio.Lock) -> None:
-        """Attach write connection/lock for node mutations."""
+    def bind_write_backend(
+        self,
+        conn: sqlite3.Connection,
+        lock: asyncio.Lock,
+        executor: Executor | None = None,
+    ) -> None:
+        """Attach write connection/lock (and its executor) for node mutations."""
         self._write_conn = conn
         self._write_lock = lock
+        self._write_executor = executor
 
     def bind_read_lock(self, lock: asyncio.Lock) -> None:
         """Attach read lock for node queries."""
@@ -156,7 +168,8 @@ class NodeStore:
             raise RuntimeError("NodeStore write backend is not initialized")
 
         async with self._write_lock:
-            await asyncio.to_thread(
+            await store_connection.run_on_executor(
+                self._write_executor,
                 store_queries.update_node_status,
                 self._write_conn,
                 node_id=node_id,
@@ -172,7 +185,8 @@ class NodeStore:
             raise RuntimeError("NodeStore write backend is not initialized")
 
         async with self._write_lock:
-            return await asyncio.to_thread(
+            return await store_connection.run_on_executor(
+                self._write_executor,
                 store_queries.delete_nodes_for_file,
                 self._write_conn,
                 file_path=file_path,
@@ -376,7 +390,7 @@ class NodeStore:
             )
 
         async with write_lock:
-            await asyncio.to_thread(_exec, write_conn)
+            await store_connection.run_on_executor(self._write_executor, _exec, write_conn)
         return json.dumps({"id": node_id, "kind": kind})
 
     async def _graph_add_edge(self, data: dict[str, Any]) -> str:
@@ -401,7 +415,7 @@ class NodeStore:
             )
 
         async with write_lock:
-            await asyncio.to_thread(_exec, write_conn)
+            await store_connection.run_on_executor(self._write_executor, _exec, write_conn)
         return json.dumps({"from": from_id, "to": to_id, "kind": kind})
 
     def _write_backend(self) -> tuple[sqlite3.Connection, asyncio.Lock]:
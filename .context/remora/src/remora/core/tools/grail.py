@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable, Mapping
 from pathlib import Path
 from typing import Any
@@ -18,6 +20,15 @@ logger = logging.getLogger(__name__)
 
 FilesProvider = Callable[[], Awaitable[dict[str, str | bytes]]]
 
+SCRIPT_CACHE_SIZE = 256
+
+_INPUT_TYPE_TO_JSON: Mapping[str, str] = {
+    "str": "string",
+    "int": "integer",
+    "float": "number",
+    "bool": "boolean",
+}
+
 
 def _build_parameters(script: grail.GrailScript) -> dict[str, Any]:
     """Build JSON Schema parameters from script Input() declarations."""
@@ -25,16 +36,7 @@ def _build_parameters(script: grail.GrailScript) -> dict[str, Any]:
     required: list[str] = []
 
     for name, spec in script.inputs.items():
-        prop: dict[str, Any] = {}
-        type_map = {
-            "str": "string",
-            "int": "integer",
-            "float": "number",
-            "bool": "boolean",
-        }
-        type_str = spec.type_annotation
-        prop["type"] = type_map.get(type_str, "string")
-        properties[name] = prop
+        properties[name] = {"type": _INPUT_TYPE_TO_JSON.get(spec.type_annotation, "string")}
         if spec.required:
             required.append(name)
 
@@ -95,6 +97,35 @@ class GrailTool:
             )
 
 
+# grail.load parses and validates a script, so loaded scripts are reused while
+# the file's (mtime, size) is unchanged. Tools themselves are still built per
+# discovery because they bind the caller's externals and files provider. The
+# cache is an LRU: bootstrap extracts tools into a fresh temp dir per
+# activation, and those paths never hit again.
+_SCRIPT_CACHE: OrderedDict[tuple[str, str | None, str], tuple[tuple[int, int], grail.GrailScript]] = OrderedDict()
+
+
+def _load_script(
+    script_path: Path,
+    limits: grail.Limits | None,
+    grail_dir: str | Path | None,
+) -> grail.GrailScript:
+    """Load a .pym script, reusing the previous load if the file is unchanged."""
+    st = script_path.stat()
+    signature = (st.st_mtime_ns, st.st_size)
+    key = (str(script_path), None if grail_dir is None else str(grail_dir), repr(limits))
+    cached = _SCRIPT_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        _SCRIPT_CACHE.move_to_end(key)
+        return cached[1]
+    script = grail.load(str(script_path), limits=limits, grail_dir=grail_dir)
+    _SCRIPT_CACHE[key] = (signature, script)
+    _SCRIPT_CACHE.move_to_end(key)
+    if len(_SCRIPT_CACHE) > SCRIPT_CACHE_SIZE:
+        _SCRIPT_CACHE.popitem(last=False)
+    return script
+
+
 class RemoraGrailTool:
     """A tool backed by a .pym script with external helpers and virtual FS."""
 
@@ -107,8 +138,10 @@ class RemoraGrailTool:
         limits: grail.Limits | None = None,
         grail_dir: str | Path | None = None,
     ) -> None:
-        self._script = grail.load(str(script_path), limits=limits, grail_dir=grail_dir)
-        self._externals = externals
+        self._script = _load_script(script_path, limits, grail_dir)
+        # Both the helper set and the script's declared externals are fixed
+        # once loaded, so narrow the helpers to what the script uses up front.
+        self._externals = {name: fn for name, fn in externals.items() if name in self._script.externals}
         self._files_provider = files_provider
         self._limits = limits
         self._schema = ToolSchema(
@@ -125,10 +158,9 @@ class RemoraGrailTool:
         call_id = context.id if context else "unknown"
         try:
             files = await self._files_provider()
-            externals = {name: fn for name, fn in self._externals.items() if name in self._script.externals}
             result = await self._script.run(
                 inputs=arguments,
-                externals=externals,
+                externals=self._externals,
                 files=files,
                 limits=self._limits,
             )
@@ -149,12 +181,18 @@ class RemoraGrailTool:
 
 
 def build_virtual_fs(files: Mapping[str, str | bytes]) -> dict[str, str | bytes]:
-    """Normalize file paths for Grail virtual filesystem."""
-    virtual_fs: dict[str, str | bytes] = {}
-    for path, content in files.items():
-        normalized = path.replace("\\", "/").lstrip("/")
-        virtual_fs[normalized] = content
-    return virtual_fs
+    """Normalize file paths for Grail virtual filesystem.
+
+    Always returns a new dict, so callers may hand it to Grail without copying.
+    """
+    return {path.replace("\\", "/").lstrip("/"): content for path, content in files.items()}
+
+
+def _list_scripts(directory: Path) -> list[Path]:
+    """Return the .pym files directly inside *directory*, sorted by name."""
+    with os.scandir(directory) as entries:
+        names = sorted(entry.name for entry in entries if entry.name.endswith(".pym") and entry.is_file())
+    return [directory / name for name in names]
 
 
 def discover_grail_tools(
@@ -184,7 +222,7 @@ def discover_grail_tools(
         logger.warning("Agents directory does not exist: %s", agents_dir)
         return tools
 
-    for pym_file in sorted(agents_dir.glob("*.pym")):
+    for pym_file in _list_scripts(agents_dir):
         try:
             tools.append(
                 RemoraGrailTool(
@@ -206,7 +244,7 @@ def discover_grail_tools(
             for tool in tools
             if isinstance(tool, RemoraGrailTool)
         }
-        for pym_file in sorted(workspace_tools_dir.glob("*.pym")):
+        for pym_file in _list_scripts(workspace_tools_dir):
             try:
                 tools.append(
                     RemoraGrailTool(
@@ -178,15 +178,13 @@ class SpawnChildTool:
         else:
             existing = ""
 
-        # Count existing lines to determine start_line for the new stub
-        existing_lines = existing.split("\n") if existing else []
         # If the file doesn't end with a newline, we need to add one
         if existing and not existing.endswith("\n"):
             existing += "\n"
 
-        start_line = len(existing.rstrip("\n").split("\n")) + 1 if existing.strip() else 1
-        stub_lines = stub.rstrip("\n").split("\n")
-        end_line = start_line + len(stub_lines) - 1
+        # Count existing lines to determine start_line for the new stub
+        start_line = existing.rstrip("\n").count("\n") + 2 if existing.strip() else 1
+        end_line = start_line + stub.rstrip("\n").count("\n")
 
         # Append stub with a blank line separator
         if existing.strip():
@@ -3,8 +3,8 @@ from __future__ import annotations
 import asyncio
 import atexit
 import logging
+import secrets
 import time
-import uuid
 from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any
 
@@ -59,7 +59,7 @@ class RemoraLanguageServer(LanguageServer):
 
     def generate_correlation_id(self) -> str:
         self._correlation_counter += 1
-        return f"corr_{self._correlation_counter}_{uuid.uuid4().hex[:8]}"
+        return f"corr_{self._correlation_counter}_{secrets.token_hex(4)}"
 
     def note_user_activity(self, source: str = "unknown") -> None:
         self._last_user_activity_monotonic = time.monotonic()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import uuid
+import secrets
 from typing import Any
 
 
@@ -34,7 +34,7 @@ class _HeadlessServer:
         self.workspace = None
 
     def generate_correlation_id(self) -> str:
-        return uuid.uuid4().hex[:12]
+        return secrets.token_hex(6)
 
     async def emit_event(self, event: Any) -> Any:
         return event
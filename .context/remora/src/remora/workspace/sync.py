@@ -6,18 +6,74 @@ detecting added, modified, and deleted files.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+from collections.abc import Awaitable, Callable, Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Literal, TypeVar
 
 if TYPE_CHECKING:
     from remora.core.protocols import WorkspaceProtocol
 
 logger = logging.getLogger(__name__)
 
+SYNC_CONCURRENCY = 8
 
-@dataclass
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+async def _map_bounded(
+    items: Sequence[_T],
+    func: Callable[[_T], Awaitable[_R]],
+    limit: int = SYNC_CONCURRENCY,
+) -> list[_R]:
+    """Await ``func`` over *items* with at most *limit* in flight, keeping input order.
+
+    A fixed set of workers pulls from one shared iterator, so the coroutine
+    count stays at *limit* however many items there are.
+    """
+    results: list[_R] = [None] * len(items)  # type: ignore[list-item]
+    work = iter(enumerate(items))
+
+    async def worker() -> None:
+        for index, item in work:
+            results[index] = await func(item)
+
+    await asyncio.gather(*(worker() for _ in range(min(limit, len(items)))))
+    return results
+
+
+def _list_disk_files(root: Path) -> list[str]:
+    """Return POSIX paths of all files under *root*, relative to it.
+
+    Walks with ``os.scandir`` so file/dir checks come from the directory read
+    rather than a ``stat`` per entry. Symlinked directories are not descended,
+    matching ``Path.rglob``. Results are ordered as ``sorted(root.rglob("*"))``
+    would order them, i.e. component by component.
+    """
+    rel_paths: list[str] = []
+    stack: list[tuple[str, str]] = [(os.fspath(root), "")]
+    while stack:
+        dir_path, rel_prefix = stack.pop()
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    rel_path = rel_prefix + entry.name
+                    if not entry.is_dir():
+                        rel_paths.append(rel_path)
+                    elif not entry.is_symlink():
+                        stack.append((entry.path, rel_path + "/"))
+        except OSError as exc:
+            # Path.rglob silently skipped unreadable directories; keep doing so.
+            logger.debug("Skipping unreadable directory %s: %s", dir_path, exc)
+    rel_paths.sort(key=lambda rel: rel.split("/"))
+    return rel_paths
+
+
+@dataclass(slots=True)
 class SyncChange:
     """Represents a single change detected during sync scan."""
 
@@ -75,51 +131,42 @@ class WorkspaceSync:
         Returns:
             List of SyncChange objects describing detected changes.
         """
-        changes: list[SyncChange] = []
         prefix = workspace_prefix.rstrip("/")
 
         # Scan disk files for added/modified
-        for disk_path in sorted(disk_dir.rglob("*")):
-            if disk_path.is_dir():
-                continue
-
-            rel_path = disk_path.relative_to(disk_dir)
-            ws_path = f"{prefix}/{rel_path.as_posix()}"
-
-            exists = await self._workspace.exists(ws_path)
-
-            if not exists:
-                changes.append(
-                    SyncChange(
-                        path=ws_path,
-                        change_type="added",
-                        disk_path=disk_path,
-                    )
-                )
-            else:
-                # Compare content
-                disk_content = disk_path.read_text(encoding="utf-8", errors="replace")
-                try:
-                    ws_content = await self._workspace.read(ws_path)
-                    if disk_content != ws_content:
-                        changes.append(
-                            SyncChange(
-                                path=ws_path,
-                                change_type="modified",
-                                disk_path=disk_path,
-                            )
-                        )
-                except Exception:
-                    # If we can't read, treat as modified
-                    changes.append(
-                        SyncChange(
-                            path=ws_path,
-                            change_type="modified",
-                            disk_path=disk_path,
-                        )
-                    )
-
-        return changes
+        candidates = [
+            (disk_dir / rel_path, f"{prefix}/{rel_path}") for rel_path in _list_disk_files(disk_dir)
+        ]
+
+        detected = await _map_bounded(candidates, self._detect_change)
+        return [change for change in detected if change is not None]
+
+    async def _detect_change(self, candidate: tuple[Path, str]) -> SyncChange | None:
+        """Compare one disk file against its workspace copy."""
+        disk_path, ws_path = candidate
+        exists = await self._workspace.exists(ws_path)
+
+        if not exists:
+            return SyncChange(
+                path=ws_path,
+                change_type="added",
+                disk_path=disk_path,
+            )
+
+        # Compare content
+        disk_content = await asyncio.to_thread(disk_path.read_text, encoding="utf-8", errors="replace")
+        try:
+            ws_content = await self._workspace.read(ws_path)
+        except Exception:
+            # If we can't read, treat as modified
+            ws_content = None
+        if disk_content != ws_content:
+            return SyncChange(
+                path=ws_path,
+                change_type="modified",
+                disk_path=disk_path,
+            )
+        return None
 
     async def scan_deleted(
         self,
@@ -218,24 +265,17 @@ class WorkspaceSync:
         skipped: list[SyncChange] = []
         errors: list[tuple[str, str]] = []
 
-        for change in changes:
-            if dry_run:
-                synced.append(change)
-                continue
-
-            try:
-                if change.change_type in ("added", "modified"):
-                    if change.disk_path is None:
-                        skipped.append(change)
-                        continue
-                    content = change.disk_path.read_text(encoding="utf-8", errors="replace")
-                    await self._workspace.write(change.path, content)
+        if dry_run:
+            synced.extend(changes)
+        else:
+            outcomes = await _map_bounded(changes, self._apply_change)
+            for change, (status, error) in zip(changes, outcomes):
+                if status == "synced":
                     synced.append(change)
-                elif change.change_type == "deleted":
-                    await self._workspace.delete(change.path)
-                    synced.append(change)
-            except Exception as e:
-                errors.append((change.path, str(e)))
+                elif status == "skipped":
+                    skipped.append(change)
+                else:
+                    errors.append((change.path, error or ""))
 
         return SyncResult(
             synced=synced,
@@ -243,5 +283,23 @@ class WorkspaceSync:
             errors=errors,
         )
 
+    async def _apply_change(
+        self, change: SyncChange
+    ) -> tuple[Literal["synced", "skipped", "error"], str | None]:
+        """Apply one change to the workspace, reporting failure instead of raising."""
+        try:
+            if change.change_type in ("added", "modified"):
+                if change.disk_path is None:
+                    return "skipped", None
+                content = await asyncio.to_thread(
+                    change.disk_path.read_text, encoding="utf-8", errors="replace"
+                )
+                await self._workspace.write(change.path, content)
+            elif change.change_type == "deleted":
+                await self._workspace.delete(change.path)
+        except Exception as e:
+            return "error", str(e)
+        return "synced", None
+
 
 __all__ = ["SyncChange", "SyncResult", "WorkspaceSync"]